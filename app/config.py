@@ -10,25 +10,27 @@ class Settings:
     # Cache settings
     CACHE_TTL: int = 3600  # 1 hour
     CACHE_MAXSIZE: int = 1000
+    CACHE_HOT_MAXSIZE: int = 128
+    REDIS_URL: str = os.environ.get("REDIS_URL", "")
     
     # Extraction settings
     SKILL_TAXONOMY: Dict[str, List[str]] = {
         "programming_languages": [
-            "python", "java", "javascript", "c++", "c#", "go", "rust", "swift", 
-            "kotlin", "typescript", "php", "ruby", "sql", "r", "matlab"
+            "Python", "Java", "JavaScript", "C++", "C#", "Go", "Rust", "Swift",
+            "Kotlin", "TypeScript", "PHP", "Ruby", "SQL", "R", "MATLAB"
         ],
         "frameworks": [
-            "react", "angular", "vue", "django", "flask", "fastapi", "spring",
-            "node.js", "express", "laravel", "ruby on rails", "tensorflow",
-            "pytorch", "keras", "scikit-learn", "pandas", "numpy"
+            "React", "Angular", "Vue", "Django", "Flask", "FastAPI", "Spring",
+            "Node.js", "Express", "Laravel", "Ruby on Rails", "TensorFlow",
+            "PyTorch", "Keras", "scikit-learn", "pandas", "NumPy"
         ],
         "tools": [
-            "docker", "kubernetes", "aws", "azure", "gcp", "git", "jenkins",
-            "linux", "unix", "windows", "macos", "jira", "confluence"
+            "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Git", "Jenkins",
+            "Linux", "Unix", "Windows", "macOS", "Jira", "Confluence"
         ],
         "databases": [
-            "mysql", "postgresql", "mongodb", "redis", "sqlite", "oracle",
-            "cassandra", "elasticsearch"
+            "MySQL", "PostgreSQL", "MongoDB", "Redis", "SQLite", "Oracle",
+            "Cassandra", "Elasticsearch"
         ],
         "soft_skills": [
             "leadership", "communication", "teamwork", "problem solving",
@@ -1,19 +1,28 @@
 from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+import asyncio
+import json
+import logging
 import time
 from datetime import datetime
-from typing import Dict, Any
-import traceback
+from functools import lru_cache
+from typing import Dict, Any, List
 
 from app.services.file_processor import FileProcessor
-from app.services.text_analyzer import TextAnalyzer
-from app.services.skill_extractor import SkillExtractor
+from app.services.text_analyzer import text_analyzer
+from app.services.skill_extractor import skill_extractor
 from app.services.cache_manager import cache_manager
 from app.models.schemas import (
     ResumeResponse, ResumeData, PersonalInfo, WorkExperience, 
     Education, Skills, Project, Certification, SectionConfidence, ExtractionMetadata, HealthResponse
 )
 
+# All error reporting funnels through this logger at the API boundary; the
+# extractors themselves no longer print (stdout locks serialize workers)
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="AI Resume Parser API",
     description="Extract structured information from resumes with confidence scoring",
@@ -28,10 +37,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
+# Stateless helper for file handling; the analyzer/extractor singletons are
+# shared module-level instances so taxonomy and model setup happen once
 file_processor = FileProcessor()
-text_analyzer = TextAnalyzer()
-skill_extractor = SkillExtractor()
 
 @app.get("/")
 async def root():
@@ -42,51 +50,48 @@ async def parse_resume(file: UploadFile = File(...)):
     """
     Parse resume from PDF or DOCX file and return structured data
     """
+    # The pipeline is blocking (file reads, PDF parsing, regex scans), so run
+    # it in the threadpool instead of stalling the event loop
+    return await run_in_threadpool(process_resume, file)
+
+def process_resume(file: UploadFile):
+    """Run the full blocking parse pipeline for one uploaded file"""
     start_time = time.time()
     
     try:
-        print(f"Processing file: {file.filename}")
-        
+        logger.debug("Processing file: %s", file.filename)
+
         # Extract text and get file hash
         text, file_hash = file_processor.extract_text(file)
-        print(f"Extracted text length: {len(text)}")
-        
+
         # Check cache first
         cached_result = cache_manager.get(file_hash)
         if cached_result:
-            print("Cache hit!")
-            cached_result['metadata']['extraction_details']['cache_hit'] = True
-            return ResumeResponse(**cached_result)
-        
+            logger.debug("Cache hit for %s", file.filename)
+            # The cache holds the fully encoded body (with cache_hit already
+            # set), so a hit skips model validation and JSON encoding entirely
+            return Response(content=cached_result, media_type="application/json")
+
         if not text.strip():
-            print("No text extracted")
+            logger.debug("No text extracted from %s", file.filename)
             return create_empty_response(0.1, "No text extracted from file")
-        
+
         # Extract all sections with confidence scores
-        print("Extracting personal info...")
         personal_info, personal_confidence = text_analyzer.extract_personal_info(text)
-        
-        print("Extracting summary...")
         summary, summary_confidence = text_analyzer.extract_summary(text)
-        
-        print("Extracting work experience...")
         work_experience, work_confidence = text_analyzer.extract_work_experience(text)
-        
-        print("Extracting education...")
         education, education_confidence = text_analyzer.extract_education(text)
-        
-        print("Extracting skills...")
         skills, skills_confidence = skill_extractor.extract_skills(text)
-        
-        print("Extracting projects...")
         projects, projects_confidence = skill_extractor.extract_projects(text)
         
         # Create response data
+        # The extractors return slotted dataclasses; from_attributes lets the
+        # schema layer validate them without an intermediate dict copy
         resume_data = ResumeData(
-            personal_info=PersonalInfo(**personal_info),
+            personal_info=PersonalInfo.model_validate(personal_info, from_attributes=True),
             summary=summary,
-            work_experience=[WorkExperience(**exp) for exp in work_experience],
-            education=[Education(**edu) for edu in education],
+            work_experience=[WorkExperience.model_validate(exp, from_attributes=True) for exp in work_experience],
+            education=[Education.model_validate(edu, from_attributes=True) for edu in education],
             skills=Skills(**skills),
             projects=[Project(**proj) for proj in projects],
             certifications=[],
@@ -125,20 +130,46 @@ async def parse_resume(file: UploadFile = File(...)):
         
         response = ResumeResponse(data=resume_data, metadata=metadata)
         
-        # Cache the result
-        cache_manager.set(file_hash, response.dict())
+        # Cache the result pre-encoded, with the cache_hit flag already
+        # flipped for replays
+        cached_payload = response.model_dump()
+        cached_payload['metadata']['extraction_details']['cache_hit'] = True
+        cache_manager.set(file_hash, cached_payload)
         
-        print(f"Processing completed in {processing_time:.2f}s")
+        logger.info("Processed %s in %.2fs", file.filename, processing_time)
         return response
-        
-    except HTTPException as he:
-        print(f"HTTP Exception: {he}")
+
+    except HTTPException:
         raise
     except Exception as e:
-        print(f"Unexpected error: {e}")
-        print(traceback.format_exc())
+        logger.exception("Processing failed for %s", file.filename)
         raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
 
+@app.post("/parse-resumes")
+async def parse_resumes(files: List[UploadFile] = File(...)):
+    """
+    Parse a batch of resumes in one request; files are processed
+    concurrently on the threadpool and failures are reported per file
+    """
+    results = await asyncio.gather(
+        *(run_in_threadpool(process_resume, file) for file in files),
+        return_exceptions=True
+    )
+
+    responses = []
+    for file, result in zip(files, results):
+        if isinstance(result, HTTPException):
+            responses.append({"filename": file.filename, "error": result.detail})
+        elif isinstance(result, Exception):
+            responses.append({"filename": file.filename, "error": str(result)})
+        elif isinstance(result, Response):
+            # Cache hit: the body is already serialized JSON
+            responses.append({"filename": file.filename, "result": json.loads(result.body)})
+        else:
+            responses.append({"filename": file.filename, "result": result.model_dump()})
+
+    return responses
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
@@ -157,27 +188,37 @@ async def supported_formats():
         "processing_timeout": "30 seconds"
     }
 
+CONFIDENCE_WEIGHTS = {
+    'personal_info': 0.15,
+    'work_experience': 0.25,
+    'education': 0.20,
+    'skills': 0.20,
+    'summary': 0.05,
+    'projects': 0.10,
+    'certifications': 0.03,
+    'languages': 0.01,
+    'interests': 0.01
+}
+
 def calculate_overall_confidence(section_confidences: SectionConfidence) -> float:
     """Calculate weighted overall confidence score"""
-    weights = {
-        'personal_info': 0.15,
-        'work_experience': 0.25,
-        'education': 0.20,
-        'skills': 0.20,
-        'summary': 0.05,
-        'projects': 0.10,
-        'certifications': 0.03,
-        'languages': 0.01,
-        'interests': 0.01
-    }
-    
+    # Round to 3 decimals so resumes with near-identical section scores
+    # share a cache entry
+    key = tuple(
+        (section, round(confidence, 3))
+        for section, confidence in section_confidences.model_dump().items()
+    )
+    return _weighted_confidence(key)
+
+@lru_cache(maxsize=256)
+def _weighted_confidence(items: tuple) -> float:
     total_confidence = 0.0
     total_weight = 0.0
-    
-    for section, confidence in section_confidences.dict().items():
-        total_confidence += confidence * weights.get(section, 0)
-        total_weight += weights.get(section, 0)
-    
+
+    for section, confidence in items:
+        total_confidence += confidence * CONFIDENCE_WEIGHTS.get(section, 0)
+        total_weight += CONFIDENCE_WEIGHTS.get(section, 0)
+
     return total_confidence / total_weight if total_weight > 0 else 0.0
 
 def create_empty_response(confidence: float, reason: str) -> ResumeResponse:
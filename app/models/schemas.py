@@ -0,0 +1,84 @@
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any, Optional
+from datetime import datetime
+
+class PersonalInfo(BaseModel):
+    first_name: str = ""
+    last_name: str = ""
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    linkedin: str = ""
+    github: str = ""
+    portfolio: str = ""
+
+class WorkExperience(BaseModel):
+    job_title: str = ""
+    company: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    type: str = "full-time"
+    location: str = ""
+    description: List[str] = Field(default_factory=list)
+    skills_gained: List[str] = Field(default_factory=list)
+
+class Education(BaseModel):
+    degree: str = ""
+    institution: str = ""
+    start_year: str = ""
+    end_year: str = ""
+    field_of_study: str = ""
+    grade: str = ""
+
+class Skills(BaseModel):
+    technical: List[str] = Field(default_factory=list)
+    soft: List[str] = Field(default_factory=list)
+
+class Project(BaseModel):
+    name: str = ""
+    description: str = ""
+    tech_stack: List[str] = Field(default_factory=list)
+    project_url: str = ""
+
+class Certification(BaseModel):
+    name: str = ""
+    issuer: str = ""
+    date: str = ""
+
+class SectionConfidence(BaseModel):
+    personal_info: float = 0.0
+    summary: float = 0.0
+    work_experience: float = 0.0
+    education: float = 0.0
+    skills: float = 0.0
+    projects: float = 0.0
+    certifications: float = 0.0
+    languages: float = 0.0
+    interests: float = 0.0
+
+class ExtractionMetadata(BaseModel):
+    processing_time: float = 0.0
+    overall_confidence: float = 0.0
+    section_confidence: SectionConfidence
+    extraction_details: Dict[str, Any] = Field(default_factory=dict)
+
+class ResumeData(BaseModel):
+    personal_info: PersonalInfo
+    summary: str = ""
+    work_experience: List[WorkExperience] = Field(default_factory=list)
+    education: List[Education] = Field(default_factory=list)
+    skills: Skills
+    projects: List[Project] = Field(default_factory=list)
+    certifications: List[Certification] = Field(default_factory=list)
+    languages: List[str] = Field(default_factory=list)
+    interests: List[str] = Field(default_factory=list)
+
+class ResumeResponse(BaseModel):
+    data: ResumeData
+    metadata: ExtractionMetadata
+
+class HealthResponse(BaseModel):
+    status: str
+    version: str
+    timestamp: datetime
@@ -1,22 +1,108 @@
-from cachetools import TTLCache
+import json
+import threading
+from cachetools import LFUCache, TTLCache
 from typing import Any, Optional
 from app.config import settings
 
+try:
+    import orjson
+    _dumps = orjson.dumps
+except ImportError:
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(value, default=str).encode()
+
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Redis keys are namespaced so clear() can delete only this service's
+# entries; REDIS_URL may point at an instance shared with other apps
+_REDIS_PREFIX = "resume_parser:"
+
 class CacheManager:
     def __init__(self):
+        # Hot tier: small LFU holding the most-requested entries. LFU has no
+        # TTL, so promoted entries can outlive CACHE_TTL — safe only because
+        # keys are content hashes and a hash's payload never changes
+        self.hot_cache = LFUCache(maxsize=settings.CACHE_HOT_MAXSIZE)
         self.cache = TTLCache(maxsize=settings.CACHE_MAXSIZE, ttl=settings.CACHE_TTL)
-    
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
-        return self.cache.get(key)
-    
-    def set(self, key: str, value: Any) -> None:
-        """Set value in cache"""
-        self.cache[key] = value
-    
+        # cachetools is not thread-safe and every caller runs on a worker
+        # thread; even reads mutate (LFU counts, TTL expiry), so all in-process
+        # tier access is serialized. Redis calls stay outside the lock
+        self._lock = threading.Lock()
+        self._redis = self._connect_redis()
+
+    @staticmethod
+    def _connect_redis():
+        """Connect to Redis when configured, otherwise stay in-process only"""
+        if redis is None or not settings.REDIS_URL:
+            return None
+        try:
+            client = redis.Redis.from_url(settings.REDIS_URL)
+            client.ping()
+            return client
+        except Exception:
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get the encoded payload from cache, promoting hits into the hot tier"""
+        with self._lock:
+            data = self.hot_cache.get(key)
+            if data is not None:
+                return data
+
+            data = self.cache.get(key)
+            if data is not None:
+                self.hot_cache[key] = data
+                return data
+
+        if self._redis is not None:
+            try:
+                data = self._redis.get(_REDIS_PREFIX + key)
+            except Exception:
+                data = None
+            if data is not None:
+                with self._lock:
+                    self.cache[key] = data
+                    self.hot_cache[key] = data
+                return data
+
+        return None
+
+    def set(self, key: str, value: Any) -> bytes:
+        """Encode value to JSON bytes once and store the payload in all tiers"""
+        data = value if isinstance(value, bytes) else _dumps(value)
+        with self._lock:
+            self.hot_cache[key] = data
+            self.cache[key] = data
+        if self._redis is not None:
+            try:
+                self._redis.set(_REDIS_PREFIX + key, data, ex=settings.CACHE_TTL)
+            except Exception:
+                pass
+        return data
+
     def clear(self) -> None:
-        """Clear all cache"""
-        self.cache.clear()
+        """Clear all cache tiers"""
+        with self._lock:
+            self.hot_cache.clear()
+            self.cache.clear()
+        if self._redis is not None:
+            # Delete only keys in our namespace; flushdb would wipe every
+            # entry in a potentially shared database
+            try:
+                cursor = 0
+                while True:
+                    cursor, keys = self._redis.scan(
+                        cursor, match=_REDIS_PREFIX + '*', count=500
+                    )
+                    if keys:
+                        self._redis.delete(*keys)
+                    if cursor == 0:
+                        break
+            except Exception:
+                pass
 
 # Global cache instance
-cache_manager = CacheManager()
\ No newline at end of file
+cache_manager = CacheManager()
@@ -1,200 +1,242 @@
 import re
 from typing import List, Dict, Tuple, Set
 from app.config import settings
+from app.services.text_analyzer import Section
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Patterns compiled once at import instead of per call
+# Header = ALL CAPS line, or one of the known section titles in any case;
+# MULTILINE so one finditer pass over the whole text locates every header
+_SECTION_PATTERN = re.compile(
+    r'^[ \t]*(?:[A-Z][A-Z \t]{2,}|(?i:summary|experience|education|skills|projects|certifications))[ \t]*$',
+    re.MULTILINE
+)
+_URL_PATTERN = re.compile(r'https?://[^\s]+')
+# Words that mark a candidate "project name" as prose rather than a title
+_PROJECT_NAME_STOPWORDS = ('the', 'and', 'with', 'for', 'using')
+_PROJECT_PATTERNS = [
+    # Project Name - Description (Date - Date)
+    re.compile(r'^(.+?)\s*[-–]\s*(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4})\)', re.IGNORECASE),
+    # Project Name, Tech Stack
+    re.compile(r'^(.+?)\s*[,:\-]\s*(.+?)$', re.IGNORECASE),
+]
 
 class SkillExtractor:
+    # Multi-pattern matcher built from the (static) taxonomy once per process
+    _automaton = None
+    _fallback_pattern = None
+
     def __init__(self):
         self.skill_taxonomy = settings.SKILL_TAXONOMY
         self.skill_aliases = self._build_skill_aliases()
-    
+        self._soft_skills_lower = frozenset(
+            s.lower() for s in self.skill_taxonomy.get("soft_skills", [])
+        )
+        # Standardized names that are soft skills, so categorization needs no
+        # per-request lowercasing at all
+        self._soft_skill_names = frozenset(
+            std for std in self.skill_aliases.values() if std.lower() in self._soft_skills_lower
+        )
+        self._taxonomy_size = sum(
+            len(skills) for skills in self.skill_taxonomy.values() if isinstance(skills, list)
+        )
+        if SkillExtractor._automaton is None and SkillExtractor._fallback_pattern is None:
+            self._build_matcher()
+
+    def _build_matcher(self) -> None:
+        """Compile all skills and aliases into a single multi-pattern matcher"""
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for alias, standardized in self.skill_aliases.items():
+                automaton.add_word(alias, (len(alias), standardized))
+            automaton.make_automaton()
+            SkillExtractor._automaton = automaton
+        else:
+            # Single alternation compiled once; longest-first so multi-word
+            # skills win over their prefixes
+            terms = sorted(self.skill_aliases, key=len, reverse=True)
+            SkillExtractor._fallback_pattern = re.compile(
+                r'(?<!\w)(?:' + '|'.join(map(re.escape, terms)) + r')(?!\w)'
+            )
+
     def _build_skill_aliases(self) -> Dict[str, str]:
         """Build mapping from aliases to standardized skill names"""
         aliases = {}
         for category, skills in self.skill_taxonomy.items():
             for skill in skills:
+                skill_lower = skill.lower()
                 # Add the skill itself
-                aliases[skill.lower()] = skill
-                
+                aliases[skill_lower] = skill
+
                 # Add common aliases
-                if skill == "javascript":
-                    aliases.update({"js": "javascript", "es6": "javascript"})
-                elif skill == "python":
-                    aliases.update({"py": "python"})
-                elif skill == "node.js":
-                    aliases.update({"node": "node.js", "nodejs": "node.js"})
-                elif skill == "c++":
-                    aliases.update({"cpp": "c++"})
-                elif skill == "c#":
-                    aliases.update({"csharp": "c#"})
-                elif skill == "react":
-                    aliases.update({"reactjs": "react", "react.js": "react"})
-                elif skill == "aws":
-                    aliases.update({"amazon web services": "aws"})
-                elif skill == "express":
-                    aliases.update({"expressjs": "express", "express.js": "express"})
+                if skill_lower == "javascript":
+                    aliases.update({"js": skill, "es6": skill})
+                elif skill_lower == "python":
+                    aliases.update({"py": skill})
+                elif skill_lower == "node.js":
+                    aliases.update({"node": skill, "nodejs": skill})
+                elif skill_lower == "c++":
+                    aliases.update({"cpp": skill})
+                elif skill_lower == "c#":
+                    aliases.update({"csharp": skill})
+                elif skill_lower == "react":
+                    aliases.update({"reactjs": skill, "react.js": skill})
+                elif skill_lower == "aws":
+                    aliases.update({"amazon web services": skill})
+                elif skill_lower == "express":
+                    aliases.update({"expressjs": skill, "express.js": skill})
         
         return aliases
     
+    def _find_skills(self, text_lower: str) -> Set[str]:
+        """Scan lowercased text once and return standardized skill names"""
+        found_skills = set()
+
+        if self._automaton is not None:
+            last = len(text_lower) - 1
+            for end, (length, standardized) in self._automaton.iter(text_lower):
+                start = end - length + 1
+                # Enforce word boundaries around the match
+                if start > 0 and text_lower[start - 1].isalnum():
+                    continue
+                if end < last and text_lower[end + 1].isalnum():
+                    continue
+                found_skills.add(standardized)
+        else:
+            for alias in self._fallback_pattern.findall(text_lower):
+                found_skills.add(self.skill_aliases[alias])
+
+        return found_skills
+
     def extract_skills(self, text: str) -> Tuple[Dict[str, List[str]], float]:
         """Extract and categorize skills from text"""
         text_lower = text.lower()
-        found_skills = set()
-        
-        # Look for skills in taxonomy
-        for category, skills in self.skill_taxonomy.items():
-            for skill in skills:
-                skill_lower = skill.lower()
-                # Check for exact matches with word boundaries
-                if re.search(r'\b' + re.escape(skill_lower) + r'\b', text_lower):
-                    found_skills.add(self.skill_aliases.get(skill_lower, skill))
-        
-        # Look for skill aliases
-        for alias, standardized in self.skill_aliases.items():
-            if alias != standardized and re.search(r'\b' + re.escape(alias) + r'\b', text_lower):
-                found_skills.add(standardized)
-        
+        found_skills = self._find_skills(text_lower)
+
         # Categorize skills
         categorized_skills = {"technical": [], "soft": []}
         
         for skill in found_skills:
-            skill_lower = skill.lower()
-            
-            # Check if it's a soft skill
-            is_soft_skill = False
-            soft_skills_list = self.skill_taxonomy.get("soft_skills", [])
-            if isinstance(soft_skills_list, list):
-                is_soft_skill = any(skill_lower == s.lower() for s in soft_skills_list)
-            
-            if is_soft_skill:
+            if skill in self._soft_skill_names:
                 categorized_skills["soft"].append(skill)
             else:
                 categorized_skills["technical"].append(skill)
-        
+
         # Calculate confidence based on number of skills found
-        total_skills_in_taxonomy = sum(len(skills) for skills in self.skill_taxonomy.values() if isinstance(skills, list))
-        confidence = min(len(found_skills) / max(total_skills_in_taxonomy, 1) * 2, 1.0)
+        confidence = min(len(found_skills) / max(self._taxonomy_size, 1) * 2, 1.0)
         
         return categorized_skills, confidence
     
     def extract_projects(self, text: str) -> Tuple[List[Dict[str, any]], float]:
         """Extract project information with improved detection"""
         projects = []
-        
-        try:
-            # Look for projects section
-            sections = self._split_into_sections(text)
-            projects_section = None
-            
-            for section_title, section_content in sections.items():
-                if 'project' in section_title:
-                    projects_section = section_content
-                    break
-            
-            if not projects_section:
-                projects_section = text
-            
-            # Improved project detection
-            project_patterns = [
-                # Project Name - Description (Date - Date)
-                r'^(.+?)\s*[-–]\s*(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4})\)',
-                # Project Name, Tech Stack
-                r'^(.+?)\s*[,:\-]\s*(.+?)$',
-            ]
-            
-            lines = projects_section.split('\n')
-            current_project = None
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Check if this line starts a new project
-                project_found = False
-                for pattern in project_patterns:
-                    match = re.match(pattern, line, re.IGNORECASE)
-                    if match:
-                        if current_project and current_project['name']:
-                            projects.append(current_project)
-                        
-                        project_name = match.group(1).strip()
-                        project_desc = match.group(2).strip() if match.lastindex >= 2 else ""
-                        
-                        # Validate project name (not too short, not a sentence)
-                        if (len(project_name) > 2 and len(project_name) < 50 and 
-                            not project_name.endswith('.') and not any(word in project_name.lower() for word in 
-                            ['the', 'and', 'with', 'for', 'using'])):
-                            
-                            current_project = {
-                                "name": project_name,
-                                "description": project_desc,
-                                "tech_stack": self._extract_tech_from_description(project_desc),
-                                "project_url": self._extract_project_url(line)
-                            }
-                            project_found = True
-                            break
-                
-                # If no new project found, add to current project description
-                if not project_found and current_project and len(line) > 10:
-                    if len(current_project['description']) < 200:  # Limit description length
-                        current_project['description'] += " " + line
-            
-            # Add the last project
-            if current_project and current_project['name']:
-                projects.append(current_project)
-            
-        except Exception as e:
-            print(f"Error extracting projects: {e}")
-        
+
+        # Look for projects section
+        sections = self._split_into_sections(text)
+        projects_section = None
+
+        for section in sections:
+            if 'project' in section.title:
+                projects_section = section.content
+                break
+
+        if not projects_section:
+            projects_section = text
+
+        lines = projects_section.split('\n')
+        current_project = None
+
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Check if this line starts a new project
+            project_found = False
+            for pattern in _PROJECT_PATTERNS:
+                match = pattern.match(line)
+                if match:
+                    if current_project and current_project['name']:
+                        projects.append(current_project)
+
+                    project_name = match.group(1).strip()
+                    project_desc = match.group(2).strip() if match.lastindex >= 2 else ""
+
+                    # Validate project name (not too short, not a sentence)
+                    project_name_lower = project_name.lower()
+                    if (len(project_name) > 2 and len(project_name) < 50 and
+                        not project_name.endswith('.') and
+                        not any(word in project_name_lower for word in _PROJECT_NAME_STOPWORDS)):
+
+                        current_project = {
+                            "name": project_name,
+                            "description": project_desc,
+                            "tech_stack": [],
+                            "project_url": self._extract_project_url(line)
+                        }
+                        project_found = True
+                        break
+
+            # If no new project found, add to current project description
+            if not project_found and current_project and len(line) > 10:
+                if len(current_project['description']) < 200:  # Limit description length
+                    current_project['description'] += " " + line
+
+        # Add the last project
+        if current_project and current_project['name']:
+            projects.append(current_project)
+
         # Filter out poor quality projects
         quality_projects = [
-            proj for proj in projects 
+            proj for proj in projects
             if len(proj['name']) > 2 and not proj['name'].isdigit()
         ]
+
+        # Scan each description once, after all its lines were gathered; the
+        # keyword automaton shares prefixes across the whole taxonomy
+        for proj in quality_projects:
+            proj['tech_stack'] = self._extract_tech_from_description(proj['description'])
         
         confidence = min(len(quality_projects) * 0.4, 1.0)
         return quality_projects, confidence
     
-    def _split_into_sections(self, text: str) -> Dict[str, str]:
+    def _split_into_sections(self, text: str) -> List[Section]:
         """Split text into sections (copied from text_analyzer for consistency)"""
-        sections = {}
+        sections = []
         current_section = "header"
-        current_content = []
-        
-        lines = text.split('\n')
-        section_pattern = re.compile(r'^[A-Z][A-Z\s]{2,}$')
-        
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            
-            if (section_pattern.match(line) or 
-                line.lower() in ['summary', 'experience', 'education', 'skills', 'projects', 'certifications']):
-                
-                if current_content and current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                current_section = line.lower()
-                current_content = []
-            else:
-                current_content.append(line)
-        
-        if current_content and current_section:
-            sections[current_section] = '\n'.join(current_content)
-        
+        content_start = 0
+
+        for match in _SECTION_PATTERN.finditer(text):
+            content = text[content_start:match.start()].strip()
+            if content and current_section:
+                sections.append(Section(current_section, content))
+
+            current_section = match.group().strip().lower()
+            content_start = match.end() + 1  # skip the newline after the header
+
+        content = text[content_start:].strip()
+        if content and current_section:
+            sections.append(Section(current_section, content))
+
         return sections
     
     def _extract_tech_from_description(self, description: str) -> List[str]:
         """Extract technologies from project description"""
         if not description:
             return []
-        
-        tech_skills, _ = self.extract_skills(description)
-        return tech_skills["technical"]
+
+        # Reuse the single-pass scanner directly; the full extract_skills
+        # categorization and confidence math is wasted work here
+        found_skills = self._find_skills(description.lower())
+        return [skill for skill in found_skills if skill not in self._soft_skill_names]
     
     def _extract_project_url(self, text: str) -> str:
         """Extract project URL from text"""
-        url_pattern = re.compile(r'https?://[^\s]+')
-        urls = url_pattern.findall(text)
-        return urls[0] if urls else ""
\ No newline at end of file
+        match = _URL_PATTERN.search(text)
+        return match.group() if match else ""
+# Global extractor instance, shared across requests
+skill_extractor = SkillExtractor()
@@ -1,370 +1,468 @@
 import spacy
 import re
+import sys
 from typing import List, Tuple, Dict, Any
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from app.utils.validators import validate_email_address, extract_phone_numbers
 from app.config import settings
 
+# Header = ALL CAPS line, or one of the known section titles in any case;
+# MULTILINE so one finditer pass over the whole text locates every header
+_SECTION_PATTERN = re.compile(
+    r'^[ \t]*(?:[A-Z][A-Z \t]{2,}|(?i:summary|experience|education|skills|projects|certifications))[ \t]*$',
+    re.MULTILINE
+)
+
+# Remaining patterns the extractors used to compile (or pass as strings to
+# the re module cache) on every call
+_PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+# Email, social profiles and plain URLs fused into one alternation so a
+# single finditer pass replaces four independent scans over the full text;
+# lastgroup names the branch that matched
+_CONTACT_PATTERN = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b)'
+    r'|(?P<linkedin>(?:https?://)?(?:www\.)?linkedin\.com/in/[\w\-]+)'
+    r'|(?P<github>(?:https?://)?(?:www\.)?github\.com/[\w\-]+)'
+    r'|(?P<url>https?://(?:[-\w.]|%[\da-fA-F]{2})+)'
+)
+# Delete table keeping only digits and '+', for counting phone characters
+# with one C-level bytes.translate instead of a regex substitution
+_NON_PHONE_BYTES = bytes(b for b in range(256) if b not in b'0123456789+')
+_LOCATION_PATTERNS = [
+    re.compile(r'(\w+,\s*\w+,\s*\w+,\s*\d+)'),  # City, State, Country, Zip
+    re.compile(r'(\w+,\s*\w+,\s*\w+)'),  # City, State, Country
+    re.compile(r'(\w+,\s*\w+)'),  # City, State
+]
+# Authored in lowercase and matched against a once-lowercased section, so
+# the regex engine never case-folds per character; the IGNORECASE compiles
+# are kept as a fallback for the rare text where .lower() changes length
+# and the indices would no longer line up
+_JOB_PATTERN_STRINGS = [
+    # Company - Title (Date - Date)
+    r'(.+?)\s*[-–]\s*(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4}|present)\)',
+    # Title at Company (Date - Date)
+    r'(.+?)\s+at\s+(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4}|present)\)',
+]
+_JOB_PATTERNS = [re.compile(p) for p in _JOB_PATTERN_STRINGS]
+_JOB_PATTERNS_CI = [re.compile(p, re.IGNORECASE) for p in _JOB_PATTERN_STRINGS]
+_EDU_PATTERN_STRINGS = [
+    # Institution - Degree (Year - Year)
+    r'(.+?)\s*[-–]\s*(.+?)\s*\((\d{4})\s*[-–]\s*(\d{4}|present)\)',
+    # Degree from Institution (Year - Year)
+    r'(.+?)\s+from\s+(.+?)\s*\(?\s*(\d{4})\s*[-–]\s*(\d{4})\s*\)?',
+]
+_EDU_PATTERNS = [re.compile(p) for p in _EDU_PATTERN_STRINGS]
+_EDU_PATTERNS_CI = [re.compile(p, re.IGNORECASE) for p in _EDU_PATTERN_STRINGS]
+_GRADE_PATTERNS = [
+    re.compile(r'(\d+\.\d+)\s*(?:CGPA|GPA)', re.IGNORECASE),
+    re.compile(r'(\d+)\s*%', re.IGNORECASE),
+    re.compile(r'Grade:\s*([A-B][+-]?)', re.IGNORECASE),
+]
+_YEAR_PATTERN = re.compile(r'(\d{4})')
+_JOB_BOUNDARY_PATTERN = re.compile(r'.*[\(\)].*\d{4}.*')
+
+# Keyword tuples for the per-line scans, hoisted so the hot loops neither
+# rebuild the lists nor re-lowercase a line per keyword
+_NAME_SKIP_KEYWORDS = ('phone', 'email', 'linkedin', 'github', 'summary', 'experience')
+_NAME_MARKER_KEYWORDS = ('@', 'phone', 'email', 'linkedin')
+_SUMMARY_KEYWORDS = ('summary', 'objective', 'about', 'profile')
+_SUMMARY_STOP_KEYWORDS = ('experience', 'education', 'skills', 'projects')
+_EXPERIENCE_KEYWORDS = ('experience', 'work', 'employment')
+
+# Employment classification: lower rank wins, full-time is the default.
+# Word-bounded so keywords next to punctuation still match while 'intern'
+# inside words like 'international' does not; authored lowercase and run
+# against a lowercased title
+_EMPLOYMENT_PATTERN = re.compile(
+    r'\b(?:intern(?:ship)?|freelance|contract|consultant|part[-\s]?time)\b'
+)
+_EMPLOYMENT_RANKS = {
+    'intern': 0, 'internship': 0,
+    'freelance': 1, 'contract': 1, 'consultant': 1,
+}
+# Enum-like values are interned so every record shares one string object
+_PRESENT = sys.intern('Present')
+_EMPLOYMENT_TYPES = tuple(
+    sys.intern(t) for t in ('internship', 'contract', 'part-time', 'full-time')
+)
+
+# Month lookup keyed by the first three letters of the month name
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+_ALPHA_RUN_PATTERN = re.compile(r'[a-z]+')
+
+@dataclass(slots=True)
+class Section:
+    """One resume section, in document order"""
+    title: str
+    content: str
+
+# Slotted records instead of per-resume dicts: no __dict__ per instance,
+# and the Pydantic schema layer validates them via from_attributes
+
+@dataclass(slots=True)
+class PersonalInfo:
+    """Contact details pulled from the resume header"""
+    first_name: str = ""
+    last_name: str = ""
+    full_name: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    linkedin: str = ""
+    github: str = ""
+    portfolio: str = ""
+
+@dataclass(slots=True)
+class Experience:
+    """One work experience entry"""
+    job_title: str = ""
+    company: str = ""
+    start_date: str = ""
+    end_date: str = ""
+    type: str = "full-time"
+    location: str = ""
+    description: List[str] = field(default_factory=list)
+    skills_gained: List[str] = field(default_factory=list)
+
+@dataclass(slots=True)
+class Education:
+    """One education entry"""
+    degree: str = ""
+    institution: str = ""
+    start_year: str = ""
+    end_year: str = ""
+    field_of_study: str = ""
+    grade: str = ""
+
+@lru_cache(maxsize=32)
+def _split_lines(text: str) -> tuple:
+    """Line index for a text, cached because several extractors walk the
+    same request text (and the same experience section) repeatedly"""
+    return tuple(text.split('\n'))
+
+@lru_cache(maxsize=1)
+def _load_nlp():
+    """Load the spaCy model once per process, shared by every analyzer"""
+    try:
+        # Only the NER component is of interest here; excluding the rest
+        # cuts model load time and per-document processing cost
+        return spacy.load(
+            "en_core_web_sm",
+            exclude=["tagger", "parser", "attribute_ruler", "lemmatizer"]
+        )
+    except OSError:
+        return None
+
 class TextAnalyzer:
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            self.nlp = None
-        self.skill_patterns = self._build_skill_patterns()
-    
-    def _build_skill_patterns(self) -> Dict[str, re.Pattern]:
-        """Build regex patterns for skill extraction"""
-        patterns = {
-            'email': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            'url': re.compile(r'https?://(?:[-\w.]|(?:%[\da-fA-F]{2}))+'),
-            'linkedin': re.compile(r'linkedin\.com/in/[\w-]+'),
-            'github': re.compile(r'github\.com/[\w-]+'),
-        }
-        return patterns
+    @property
+    def nlp(self):
+        """spaCy model, loaded lazily: the ingest path is pure regex, so the
+        model only costs anything once something actually queries it"""
+        return _load_nlp()
+
+    def pipe_documents(self, texts: List[str], batch_size: int = 32) -> List[Any]:
+        """Process many texts in one spaCy pipe call instead of one nlp() each"""
+        if self.nlp is None or not texts:
+            return []
+        # Short resumes are dominated by per-batch overhead, so let them
+        # share much larger batches
+        avg_len = sum(map(len, texts)) / len(texts)
+        if avg_len < 2000:
+            batch_size = max(batch_size, 128)
+        return list(self.nlp.pipe(texts, batch_size=batch_size))
     
-    def extract_personal_info(self, text: str) -> Tuple[Dict[str, Any], float]:
+    def extract_personal_info(self, text: str) -> Tuple[PersonalInfo, float]:
         """Extract personal information with confidence score"""
-        personal_info = {
-            "first_name": "", "last_name": "", "full_name": "",
-            "email": "", "phone": "", "location": "",
-            "linkedin": "", "github": "", "portfolio": ""
-        }
+        personal_info = PersonalInfo()
         confidence_factors = []
-        
-        try:
-            # Extract email
-            emails = self.skill_patterns['email'].findall(text)
-            if emails:
-                personal_info['email'] = emails[0]
-                confidence_factors.append(0.3)
-            
-            # Extract phone numbers - improved pattern
-            phone_pattern = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
-            phones = phone_pattern.findall(text)
-            if phones:
-                # Take the first phone number that has proper length
-                for phone in phones:
-                    if isinstance(phone, tuple):
-                        phone = ''.join(phone)
-                    phone_clean = re.sub(r'[^\d+]', '', phone)
-                    if len(phone_clean) >= 10:
-                        personal_info['phone'] = phone
-                        confidence_factors.append(0.2)
-                        break
-            
-            # Extract URLs and social links
-            urls = self.skill_patterns['url'].findall(text)
-            linkedin_links = self.skill_patterns['linkedin'].findall(text)
-            github_links = self.skill_patterns['github'].findall(text)
-            
-            if linkedin_links:
-                personal_info['linkedin'] = f"https://{linkedin_links[0]}"
-            if github_links:
-                personal_info['github'] = f"https://{github_links[0]}"
-            
-            # Extract portfolio (other URLs that aren't social media)
-            other_urls = [url for url in urls if not any(domain in url for domain in ['linkedin', 'github'])]
-            if other_urls:
-                personal_info['portfolio'] = other_urls[0]
-            
-            # Extract name from the beginning of the text
-            lines = text.split('\n')
-            for line in lines[:5]:  # Check first 5 lines for name
-                line = line.strip()
-                if line and not any(keyword in line.lower() for keyword in 
-                                  ['phone', 'email', 'linkedin', 'github', 'summary', 'experience']):
-                    # Simple name validation: 2-4 words, capitalized
-                    words = line.split()
-                    if 2 <= len(words) <= 4 and all(word[0].isupper() for word in words if word):
-                        personal_info['full_name'] = line
-                        name_parts = line.split()
-                        personal_info['first_name'] = name_parts[0]
-                        personal_info['last_name'] = name_parts[-1]
-                        confidence_factors.append(0.3)
-                        break
-            
-            # Extract location using simple pattern matching
-            location_patterns = [
-                r'(\w+,\s*\w+,\s*\w+,\s*\d+)',  # City, State, Country, Zip
-                r'(\w+,\s*\w+,\s*\w+)',  # City, State, Country
-                r'(\w+,\s*\w+)',  # City, State
-            ]
-            
-            for pattern in location_patterns:
-                locations = re.findall(pattern, text)
-                if locations:
-                    personal_info['location'] = locations[0]
-                    confidence_factors.append(0.2)
+
+        # One fused scan collects email, linkedin, github and portfolio
+        # URLs; the first match of each kind wins
+        contact = {}
+        for match in _CONTACT_PATTERN.finditer(text):
+            kind = match.lastgroup
+            value = match.group()
+            # Social links the named branches missed still must not be
+            # reported as a portfolio
+            if kind == 'url' and ('linkedin' in value or 'github' in value):
+                continue
+            contact.setdefault(kind, value)
+
+        if 'email' in contact:
+            personal_info.email = contact['email']
+            confidence_factors.append(0.3)
+        if 'linkedin' in contact:
+            link = contact['linkedin']
+            personal_info.linkedin = f"https://{link[link.find('linkedin.com'):]}"
+        if 'github' in contact:
+            link = contact['github']
+            personal_info.github = f"https://{link[link.find('github.com'):]}"
+        if 'url' in contact:
+            personal_info.portfolio = contact['url']
+
+        # Extract phone numbers - take the first one with proper length;
+        # finditer yields full matches lazily, so the scan stops early
+        for phone_match in _PHONE_PATTERN.finditer(text):
+            phone = phone_match.group()
+            phone_digits = phone.encode('ascii', 'ignore').translate(None, _NON_PHONE_BYTES)
+            if len(phone_digits) >= 10:
+                personal_info.phone = phone
+                confidence_factors.append(0.2)
+                break
+
+        # Extract name from the beginning of the text
+        lines = _split_lines(text)
+        for line in lines[:5]:  # Check first 5 lines for name
+            line = line.strip()
+            line_lower = line.lower()
+            if line and not any(keyword in line_lower for keyword in _NAME_SKIP_KEYWORDS):
+                # Simple name validation: 2-4 words, capitalized
+                words = line.split()
+                if 2 <= len(words) <= 4 and all(word[0].isupper() for word in words if word):
+                    personal_info.full_name = line
+                    name_parts = line.split()
+                    personal_info.first_name = name_parts[0]
+                    personal_info.last_name = name_parts[-1]
+                    confidence_factors.append(0.3)
                     break
-            
-        except Exception as e:
-            print(f"Error in personal info extraction: {e}")
-        
+
+        # Extract location using simple pattern matching
+        for pattern in _LOCATION_PATTERNS:
+            location_match = pattern.search(text)
+            if location_match:
+                personal_info.location = location_match.group(1)
+                confidence_factors.append(0.2)
+                break
+
         confidence = sum(confidence_factors) if confidence_factors else 0.0
         return personal_info, confidence
     
     def extract_summary(self, text: str) -> Tuple[str, float]:
         """Extract professional summary with confidence"""
-        try:
-            # Find summary section
-            sections = self._split_into_sections(text)
-            
-            # Look for summary section
-            summary_keywords = ['summary', 'objective', 'about', 'profile']
-            for section_title, section_content in sections.items():
-                if any(keyword in section_title.lower() for keyword in summary_keywords):
-                    # Take first paragraph of summary section
-                    paragraphs = [p.strip() for p in section_content.split('\n') if p.strip()]
-                    if paragraphs:
-                        return paragraphs[0], 0.8
-            
-            # Fallback: find first meaningful paragraph after name
-            lines = text.split('\n')
-            found_name = False
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Assume we found name in previous lines
-                if found_name and len(line) > 50 and not any(keyword in line.lower() for keyword in 
-                                                           ['experience', 'education', 'skills', 'projects']):
-                    return line, 0.6
-                
-                # Mark when we likely found the name section
-                if any(word in line.lower() for word in ['@', 'phone', 'email', 'linkedin']):
-                    found_name = True
-            
-            return "", 0.3
-        except:
-            return "", 0.0
-    
-    def _split_into_sections(self, text: str) -> Dict[str, str]:
-        """Split resume text into sections"""
-        sections = {}
-        current_section = "header"
-        current_content = []
-        
-        lines = text.split('\n')
-        section_pattern = re.compile(r'^[A-Z][A-Z\s]{2,}$')  # ALL CAPS section headers
-        
+        # Find summary section
+        sections = self._split_into_sections(text)
+
+        # Look for summary section (titles are already lowercased)
+        for section in sections:
+            if any(keyword in section.title for keyword in _SUMMARY_KEYWORDS):
+                # Take first paragraph of summary section
+                paragraphs = [p.strip() for p in section.content.split('\n') if p.strip()]
+                if paragraphs:
+                    return paragraphs[0], 0.8
+
+        # Fallback: find first meaningful paragraph after name
+        lines = _split_lines(text)
+        found_name = False
         for line in lines:
             line = line.strip()
             if not line:
                 continue
-            
-            # Check if this line is a section header
-            if (section_pattern.match(line) or 
-                line.lower() in ['summary', 'experience', 'education', 'skills', 'projects', 'certifications']):
-                
-                # Save previous section
-                if current_content and current_section:
-                    sections[current_section] = '\n'.join(current_content)
-                
-                # Start new section
-                current_section = line.lower()
-                current_content = []
-            else:
-                current_content.append(line)
-        
+            line_lower = line.lower()
+
+            # Assume we found name in previous lines
+            if found_name and len(line) > 50 and not any(
+                    keyword in line_lower for keyword in _SUMMARY_STOP_KEYWORDS):
+                return line, 0.6
+
+            # Mark when we likely found the name section
+            if any(word in line_lower for word in _NAME_MARKER_KEYWORDS):
+                found_name = True
+
+        return "", 0.3
+    
+    def _split_into_sections(self, text: str) -> List[Section]:
+        """Split resume text into sections, preserving document order"""
+        sections = []
+        current_section = "header"
+        content_start = 0
+
+        # One finditer pass locates every header; section bodies are the
+        # slices between consecutive headers
+        for match in _SECTION_PATTERN.finditer(text):
+            content = text[content_start:match.start()].strip()
+            if content and current_section:
+                sections.append(Section(current_section, content))
+
+            current_section = match.group().strip().lower()
+            content_start = match.end() + 1  # skip the newline after the header
+
         # Save the last section
-        if current_content and current_section:
-            sections[current_section] = '\n'.join(current_content)
-        
+        content = text[content_start:].strip()
+        if content and current_section:
+            sections.append(Section(current_section, content))
+
         return sections
     
-    def extract_work_experience(self, text: str) -> Tuple[List[Dict[str, Any]], float]:
+    def extract_work_experience(self, text: str) -> Tuple[List[Experience], float]:
         """Extract work experience with improved detection"""
         experiences = []
-        
-        try:
-            sections = self._split_into_sections(text)
-            
-            # Look for experience section
-            exp_keywords = ['experience', 'work', 'employment']
-            exp_section = None
-            
-            for section_title, section_content in sections.items():
-                if any(keyword in section_title for keyword in exp_keywords):
-                    exp_section = section_content
-                    break
-            
-            if not exp_section:
-                # Try to find experience patterns in entire text
-                exp_section = text
-            
-            # Improved job pattern matching
-            job_patterns = [
-                # Company - Title (Date - Date)
-                r'(.+?)\s*[-–]\s*(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4}|Present)\)',
-                # Title at Company (Date - Date)
-                r'(.+?)\s+at\s+(.+?)\s*\((\w+\s*\d{4})\s*[-–]\s*(\w+\s*\d{4}|Present)\)',
-            ]
-            
-            for pattern in job_patterns:
-                matches = re.finditer(pattern, exp_section, re.IGNORECASE)
-                for match in matches:
-                    if match.lastindex >= 4:
-                        experience = {
-                            "job_title": match.group(2).strip() if ' at ' in match.group(0) else match.group(1).strip(),
-                            "company": match.group(1).strip() if ' at ' in match.group(0) else match.group(2).strip(),
-                            "start_date": self._parse_date(match.group(3)),
-                            "end_date": self._parse_date(match.group(4)) if match.group(4) != "Present" else "Present",
-                            "type": self._detect_employment_type(match.group(2) if ' at ' in match.group(0) else match.group(1)),
-                            "location": "",
-                            "description": self._extract_job_description(exp_section, match.group(0)),
-                            "skills_gained": []
-                        }
-                        experiences.append(experience)
-            
-        except Exception as e:
-            print(f"Error in work experience extraction: {e}")
-        
+
+        sections = self._split_into_sections(text)
+
+        # Look for experience section
+        exp_section = None
+
+        for section in sections:
+            if any(keyword in section.title for keyword in _EXPERIENCE_KEYWORDS):
+                exp_section = section.content
+                break
+
+        if not exp_section:
+            # Try to find experience patterns in entire text
+            exp_section = text
+
+        # Lowercase once and match caseless patterns against that copy;
+        # spans index into the original section for the cased fields
+        section_lower = exp_section.lower()
+        if len(section_lower) == len(exp_section):
+            haystack, patterns = section_lower, _JOB_PATTERNS
+        else:
+            haystack, patterns = exp_section, _JOB_PATTERNS_CI
+
+        for pattern in patterns:
+            matches = pattern.finditer(haystack)
+            for match in matches:
+                if match.lastindex >= 4:
+                    at_form = ' at ' in match.group(0)
+                    title_idx = 2 if at_form else 1
+                    company_idx = 1 if at_form else 2
+                    experience = Experience(
+                        job_title=exp_section[slice(*match.span(title_idx))].strip(),
+                        company=exp_section[slice(*match.span(company_idx))].strip(),
+                        start_date=self._parse_date(match.group(3)),
+                        end_date=self._parse_date(match.group(4)),
+                        type=self._detect_employment_type(match.group(title_idx)),
+                        description=self._extract_job_description(
+                            exp_section, exp_section[slice(*match.span())]
+                        ),
+                    )
+                    experiences.append(experience)
+
         confidence = min(len(experiences) * 0.3, 1.0)
         return experiences, confidence
     
     def _parse_date(self, date_str: str) -> str:
         """Parse various date formats to MM/YYYY"""
-        try:
-            # Handle common date formats
-            date_str = date_str.strip()
-            if not date_str or date_str.lower() == 'present':
-                return "Present"
-            
-            # Simple month-year parsing
-            month_map = {
-                'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-            }
-            
-            for month_name, month_num in month_map.items():
-                if month_name in date_str.lower():
-                    year_match = re.search(r'(\d{4})', date_str)
-                    if year_match:
-                        return f"{month_num}/{year_match.group(1)}"
-            
-            # Try to extract year
-            year_match = re.search(r'(\d{4})', date_str)
-            if year_match:
-                return f"01/{year_match.group(1)}"
-            
-            return date_str
-        except:
-            return date_str
+        # Handle common date formats
+        date_str = date_str.strip()
+        date_lower = date_str.lower()
+        if not date_str or date_lower == 'present':
+            return _PRESENT
+
+        # Scan for the year at most once; both branches reuse the match
+        year_match = _YEAR_PATTERN.search(date_str)
+        if year_match:
+            # Simple month-year parsing: one dict probe on the first word's
+            # prefix instead of twelve substring scans
+            word_match = _ALPHA_RUN_PATTERN.search(date_lower)
+            if word_match:
+                month_num = _MONTH_MAP.get(word_match.group()[:3])
+                if month_num:
+                    return f"{month_num}/{year_match.group(1)}"
+            return f"01/{year_match.group(1)}"
+
+        return date_str
     
     def _extract_job_description(self, text: str, job_context: str) -> List[str]:
         """Extract job description bullets"""
         descriptions = []
-        try:
-            # Find the paragraph after the job entry
-            lines = text.split('\n')
-            found_job = False
-            
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                if job_context in line:
-                    found_job = True
-                    continue
-                
-                if found_job:
-                    # Stop at next job entry or section
-                    if re.match(r'.*[\(\)].*\d{4}.*', line) or len(line) < 10:
-                        break
-                    
-                    # Add meaningful lines as descriptions
-                    if len(line) > 20 and not line.startswith('-'):
-                        descriptions.append(line)
-                    
-                    if len(descriptions) >= 3:  # Limit to 3 bullets
-                        break
-        
-        except Exception as e:
-            print(f"Error extracting job description: {e}")
-        
+        # One substring search locates the job entry instead of testing
+        # job_context against every line; only the text after it is walked
+        idx = text.find(job_context)
+        if idx == -1:
+            return descriptions
+
+        for line in text[idx + len(job_context):].split('\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Stop at next job entry or section
+            if _JOB_BOUNDARY_PATTERN.match(line) or len(line) < 10:
+                break
+
+            # Add meaningful lines as descriptions
+            if len(line) > 20 and not line.startswith('-'):
+                descriptions.append(line)
+
+            if len(descriptions) >= 3:  # Limit to 3 bullets
+                break
+
         return descriptions
     
-    def extract_education(self, text: str) -> Tuple[List[Dict[str, Any]], float]:
+    def extract_education(self, text: str) -> Tuple[List[Education], float]:
         """Extract education information with improved detection"""
         education = []
-        
-        try:
-            sections = self._split_into_sections(text)
-            
-            # Look for education section
-            edu_section = None
-            for section_title, section_content in sections.items():
-                if 'education' in section_title:
-                    edu_section = section_content
-                    break
-            
-            if not edu_section:
-                edu_section = text
-            
-            # Improved education pattern matching
-            edu_patterns = [
-                # Institution - Degree (Year - Year)
-                r'(.+?)\s*[-–]\s*(.+?)\s*\((\d{4})\s*[-–]\s*(\d{4}|Present)\)',
-                # Degree from Institution (Year - Year)
-                r'(.+?)\s+from\s+(.+?)\s*\(?\s*(\d{4})\s*[-–]\s*(\d{4})\s*\)?',
-            ]
-            
-            for pattern in edu_patterns:
-                matches = re.finditer(pattern, edu_section, re.IGNORECASE)
-                for match in matches:
-                    if match.lastindex >= 4:
-                        edu_entry = {
-                            "degree": match.group(2).strip() if ' from ' in match.group(0) else match.group(1).strip(),
-                            "institution": match.group(1).strip() if ' from ' in match.group(0) else match.group(2).strip(),
-                            "start_year": match.group(3),
-                            "end_year": match.group(4),
-                            "field_of_study": "",
-                            "grade": self._extract_grade(edu_section, match.group(0))
-                        }
-                        education.append(edu_entry)
-            
-        except Exception as e:
-            print(f"Error in education extraction: {e}")
-        
+
+        sections = self._split_into_sections(text)
+
+        # Look for education section
+        edu_section = None
+        for section in sections:
+            if 'education' in section.title:
+                edu_section = section.content
+                break
+
+        if not edu_section:
+            edu_section = text
+
+        # Same lowercase-once strategy as extract_work_experience
+        section_lower = edu_section.lower()
+        if len(section_lower) == len(edu_section):
+            haystack, patterns = section_lower, _EDU_PATTERNS
+        else:
+            haystack, patterns = edu_section, _EDU_PATTERNS_CI
+
+        for pattern in patterns:
+            matches = pattern.finditer(haystack)
+            for match in matches:
+                if match.lastindex >= 4:
+                    from_form = ' from ' in match.group(0)
+                    degree_idx = 2 if from_form else 1
+                    institution_idx = 1 if from_form else 2
+                    edu_entry = Education(
+                        degree=edu_section[slice(*match.span(degree_idx))].strip(),
+                        institution=edu_section[slice(*match.span(institution_idx))].strip(),
+                        start_year=match.group(3),
+                        end_year=edu_section[slice(*match.span(4))],
+                        grade=self._extract_grade(edu_section, match.group(0)),
+                    )
+                    education.append(edu_entry)
+
         confidence = min(len(education) * 0.3, 1.0)
         return education, confidence
     
     def _extract_grade(self, text: str, context: str) -> str:
         """Extract grade/CGPA information"""
-        try:
-            # Look for grade patterns near the education entry
-            grade_patterns = [
-                r'(\d+\.\d+)\s*(?:CGPA|GPA)',
-                r'(\d+)\s*%',
-                r'Grade:\s*([A-B][+-]?)',
-            ]
-            
-            for pattern in grade_patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(1)
-        
-        except:
-            pass
-        
+        # Cheap substring prefilter: every grade pattern requires one of
+        # these markers, and C-level `in` scans beat three regex passes
+        text_lower = text.lower()
+        if 'gpa' not in text_lower and 'grade' not in text_lower and '%' not in text:
+            return ""
+
+        # Look for grade patterns near the education entry
+        for pattern in _GRADE_PATTERNS:
+            match = pattern.search(text)
+            if match:
+                return match.group(1)
+
         return ""
     
     def _detect_employment_type(self, job_title: str) -> str:
         """Detect employment type from job title"""
-        try:
-            job_title_lower = job_title.lower()
-            
-            if 'intern' in job_title_lower:
-                return 'internship'
-            elif any(word in job_title_lower for word in ['freelance', 'contract', 'consultant']):
-                return 'contract'
-            elif 'part' in job_title_lower and 'time' in job_title_lower:
-                return 'part-time'
-            else:
-                return 'full-time'
-        except:
-            return 'full-time'
\ No newline at end of file
+        # One pass of the word-bounded alternation; keywords missing from
+        # the rank table are the part-time spellings
+        rank = 3
+        for match in _EMPLOYMENT_PATTERN.finditer(job_title.lower()):
+            keyword_rank = _EMPLOYMENT_RANKS.get(match.group(), 2)
+            if keyword_rank < rank:
+                rank = keyword_rank
+        return _EMPLOYMENT_TYPES[rank]
+# Global analyzer instance, shared across requests
+text_analyzer = TextAnalyzer()
@@ -2,10 +2,25 @@ import re
 import phonenumbers
 from email_validator import validate_email, EmailNotValidError
 
-def validate_email_address(email: str) -> bool:
-    """Validate email format"""
+# Fast-path shape check; the full validator only runs when this passes
+_EMAIL_PATTERN = re.compile(r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$')
+
+# Compiled once at import instead of per extract_phone_numbers call
+_PHONE_PATTERNS = [
+    re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'),
+    re.compile(r'\b\d{10}\b'),
+    re.compile(r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b')
+]
+
+def validate_email_address(email: str, check_deliverability: bool = False) -> bool:
+    """Validate email format; DNS deliverability is only checked on demand"""
+    # Reject obviously malformed addresses with one compiled-regex match
+    # before paying for the full RFC validator
+    if not _EMAIL_PATTERN.match(email):
+        return False
+
     try:
-        validate_email(email)
+        validate_email(email, check_deliverability=check_deliverability)
         return True
     except EmailNotValidError:
         return False
@@ -20,15 +35,9 @@ def validate_phone_number(phone: str) -> bool:
 
 def extract_phone_numbers(text: str) -> list:
     """Extract phone numbers from text"""
-    phone_patterns = [
-        r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\b\d{10}\b',
-        r'\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b'
-    ]
-    
     phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
+    for pattern in _PHONE_PATTERNS:
+        matches = pattern.findall(text)
         for match in matches:
             if isinstance(match, tuple):
                 match = ''.join(match)
@@ -24,6 +24,19 @@ def test_parse_resume_invalid_file():
     )
     assert response.status_code == 400
 
+def test_parse_resumes_batch_reports_per_file_errors():
+    response = client.post(
+        "/parse-resumes",
+        files=[
+            ("files", ("a.txt", b"invalid content", "text/plain")),
+            ("files", ("b.txt", b"invalid content", "text/plain")),
+        ]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 2
+    assert all("error" in item for item in data)
+
 def test_parse_resume_empty_file():
     response = client.post(
         "/parse-resume", 
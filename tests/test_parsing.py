@@ -18,7 +18,7 @@ def test_extract_personal_info(text_analyzer):
     New York, USA
     """
     personal_info, confidence = text_analyzer.extract_personal_info(text)
-    assert personal_info["email"] == "john.doe@email.com"
+    assert personal_info.email == "john.doe@email.com"
     assert confidence > 0
 
 def test_extract_skills(skill_extractor):